@@ -32,34 +32,29 @@ def run(context):
         
         filename = fileDlg.filename
 
-        # 3. Extract and write data
-        count = 0
+        # 3. Extract raw world coordinates (Fusion default unit is Centimeter)
+        # Only process lines (SketchLine); resolve each selected entity once
+        SketchLine = adsk.fusion.SketchLine
+        sel_item = sel.item
+        entities = [sel_item(i).entity for i in range(sel.count)]
+        cables = [e for e in entities if isinstance(e, SketchLine)]
+
+        rows = []
+        for cable in cables:
+            sp = cable.startSketchPoint.worldGeometry
+            ep = cable.endSketchPoint.worldGeometry
+            rows.append((sp.x, sp.y, sp.z, ep.x, ep.y, ep.z))
+
+        # 4. Convert all coordinates to METERS (/100) in one pass, as PyChrono uses SI units
+        rows = [[c / 100.0 for c in row] for row in rows]
+        count = len(rows)
+
+        # 5. Build the whole CSV in memory and write it with a single call
+        # Header is required for Pandas
+        lines = ['StartX,StartY,StartZ,EndX,EndY,EndZ']
+        lines.extend(f"{sx},{sy},{sz},{ex},{ey},{ez}" for sx, sy, sz, ex, ey, ez in rows)
         with open(filename, 'w') as f:
-            # Write header (required for Pandas)
-            f.write('StartX,StartY,StartZ,EndX,EndY,EndZ\n')
-            
-            for i in range(sel.count):
-                entity = sel.item(i).entity
-                
-                # Only process if it's a line (SketchLine)
-                if isinstance(entity, adsk.fusion.SketchLine):
-                    # Extract world coordinates (WorldGeometry)
-                    # Fusion default unit is Centimeter
-                    start_point = entity.startSketchPoint.worldGeometry
-                    end_point = entity.endSketchPoint.worldGeometry
-                    
-                    # Convert to METERS (/100), as PyChrono uses SI units
-                    sx = start_point.x / 100.0
-                    sy = start_point.y / 100.0
-                    sz = start_point.z / 100.0
-                    
-                    ex = end_point.x / 100.0
-                    ey = end_point.y / 100.0
-                    ez = end_point.z / 100.0
-                    
-                    # Write row to file
-                    f.write(f"{sx},{sy},{sz},{ex},{ey},{ez}\n")
-                    count += 1
+            f.write('\n'.join(lines) + '\n')
         
         ui.messageBox(f'Success! Coordinates of {count} cables exported to:\n{filename}')
 